@@ -0,0 +1,98 @@
+import pygame
+from typing import Dict, List, Tuple
+
+class HUD:
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        
+        # Colors
+        self.BLACK = (0, 0, 0)
+        self.WHITE = (255, 255, 255)
+        self.GREEN = (0, 255, 0)
+        
+        # Fonts are loaded once here, never inside the frame loop
+        self.font = pygame.font.Font(None, 24)
+        self.title_font = pygame.font.Font(None, 72)
+        
+        # Rendered text surfaces keyed by (text, font, color)
+        self.text_cache: Dict[tuple, pygame.Surface] = {}
+        self.hits = 0
+        self.misses = 0
+        
+        # Last (text, font, color) key and surface for each changing value (e.g. FPS)
+        self.values: Dict[str, Tuple[tuple, pygame.Surface]] = {}
+        
+        # Static panels, composed once into a single surface each
+        self.instructions_panel = self._compose_panel([
+            (self.render_text("WASD: Move", self.font, self.BLACK), {"topleft": (10, 40)}),
+            (self.render_text("Mouse: Look around", self.font, self.BLACK), {"topleft": (10, 60)}),
+            (self.render_text("ESC: Quit", self.font, self.BLACK), {"topleft": (10, 80)}),
+        ])
+        self.win_panel = self._compose_panel([
+            (self.render_text("YOU ESCAPED!", self.title_font, self.GREEN),
+             {"center": (width // 2, height // 2 - 50)}),
+            (self.render_text("Press 'R' to play again", self.font, self.WHITE),
+             {"center": (width // 2, height // 2 + 20)}),
+            (self.render_text("Press ESC to quit", self.font, self.WHITE),
+             {"center": (width // 2, height // 2 + 50)}),
+        ])
+    
+    def render_text(self, text: str, font: pygame.font.Font, color: tuple) -> pygame.Surface:
+        """Render text, reusing a cached surface when available"""
+        key = (text, font, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            self.misses += 1
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+        else:
+            self.hits += 1
+        return surface
+    
+    def render_value(self, name: str, text: str, font: pygame.font.Font, color: tuple) -> pygame.Surface:
+        """Render a changing value, only re-rendering when its text changes"""
+        key = (text, font, color)
+        last = self.values.get(name)
+        if last is not None and last[0] == key:
+            self.hits += 1
+            return last[1]
+        
+        # Not kept in text_cache so values like FPS don't grow it without bound
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.values[name] = (key, surface)
+        return surface
+    
+    def _blit_panel(self, screen: pygame.Surface, panel: Tuple[pygame.Surface, Tuple[int, int]]):
+        """Blit a pre-composed panel, counted as a cache hit since nothing is rendered"""
+        self.hits += 1
+        screen.blit(*panel)
+    
+    def _compose_panel(self, items: List[Tuple[pygame.Surface, dict]]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Pre-compose positioned surfaces into one panel and its screen position"""
+        rects = [surface.get_rect(**position) for surface, position in items]
+        bounds = rects[0].unionall(rects[1:])
+        
+        panel = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for (surface, _), rect in zip(items, rects):
+            panel.blit(surface, rect.move(-bounds.x, -bounds.y))
+        return panel, bounds.topleft
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of text draws (values and panels) served without calling font.render"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def render_ui(self, screen: pygame.Surface, fps: int):
+        """Render in-game UI elements"""
+        # FPS counter
+        screen.blit(self.render_value("fps", f"FPS: {fps}", self.font, self.BLACK), (10, 10))
+        
+        # Instructions
+        self._blit_panel(screen, self.instructions_panel)
+    
+    def render_win_screen(self, screen: pygame.Surface):
+        """Render the victory screen"""
+        self._blit_panel(screen, self.win_panel)
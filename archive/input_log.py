@@ -0,0 +1,153 @@
+import pygame
+import struct
+import zlib
+from typing import List, NamedTuple, Tuple
+
+# Binary session log layout (little endian):
+#   header  - magic, version, seed, maze width/height, won flag, final pose, frame count
+#   payload - zlib-compressed frames, one per game tick
+# Frames hold dt in whole microseconds and int16 mouse deltas; the game plays
+# the quantized values so recording and replay see exactly the same input.
+MAGIC = b"LBRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBIHH?ddddI")
+FRAME = struct.Struct("<IhhB")
+MAX_SEED = 2**32 - 1
+MAX_DT_US = 2**32 - 1
+MOUSE_LIMIT = 2**15 - 1
+
+# MazeGenerator carves recursively, one frame per cell in the worst case, so
+# cap the cell count well under Python's default recursion limit of 1000
+MIN_MAZE_SIZE = 5
+MAX_MAZE_CELLS = 900
+
+# Only the keys the player reads are recorded, one bit each
+RECORDED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
+RESTART_FLAG = 0x80
+
+
+class RecordedKeys:
+    """Key state replayed from a bitmask, indexable like pygame.key.get_pressed()"""
+    __slots__ = ("mask",)
+    
+    def __init__(self, mask: int):
+        self.mask = mask
+    
+    def __getitem__(self, key: int) -> bool:
+        for bit, recorded_key in enumerate(RECORDED_KEYS):
+            if key == recorded_key:
+                return bool(self.mask & (1 << bit))
+        return False
+
+
+class InputFrame(NamedTuple):
+    dt: float
+    mouse_rel: Tuple[int, int]
+    keys: RecordedKeys
+    restart: bool
+
+
+class Recording(NamedTuple):
+    seed: int
+    maze_width: int
+    maze_height: int
+    won: bool
+    final_pose: Tuple[float, float, float, float]  # x, y, angle, pitch
+    frames: List[InputFrame]
+
+
+def check_maze_size(maze_width: int, maze_height: int):
+    """Raise ValueError unless the maze size can be generated and replayed"""
+    for size in (maze_width, maze_height):
+        if size < MIN_MAZE_SIZE or size % 2 == 0:
+            raise ValueError(f"Maze size {maze_width}x{maze_height} must be odd and at least {MIN_MAZE_SIZE}")
+    if (maze_width // 2) * (maze_height // 2) > MAX_MAZE_CELLS:
+        raise ValueError(f"Maze size {maze_width}x{maze_height} exceeds {MAX_MAZE_CELLS} cells")
+
+
+class InputRecorder:
+    def __init__(self, path: str):
+        self.path = path
+        self.seed = 0
+        self.maze_width = 0
+        self.maze_height = 0
+        self.frames = bytearray()
+        self.frame_count = 0
+        self.pending_restart = False
+    
+    def begin(self, seed: int, maze_width: int, maze_height: int):
+        """Start a new session with the given maze parameters"""
+        if not 0 <= seed <= MAX_SEED:
+            raise ValueError(f"Seed {seed} cannot be recorded, it must be 0 to {MAX_SEED}")
+        check_maze_size(maze_width, maze_height)
+        self.seed = seed
+        self.maze_width = maze_width
+        self.maze_height = maze_height
+        self.frames = bytearray()
+        self.frame_count = 0
+        self.pending_restart = False
+    
+    def mark_restart(self):
+        """Flag the next recorded tick as following a restart"""
+        self.pending_restart = True
+    
+    def record(self, dt: float, mouse_rel: tuple, keys_pressed) -> Tuple[float, Tuple[int, int]]:
+        """Append one tick of input, returning the quantized dt and mouse_rel to play"""
+        dt_us = min(max(round(dt * 1_000_000), 0), MAX_DT_US)
+        mouse_x = min(max(mouse_rel[0], -MOUSE_LIMIT), MOUSE_LIMIT)
+        mouse_y = min(max(mouse_rel[1], -MOUSE_LIMIT), MOUSE_LIMIT)
+        
+        flags = RESTART_FLAG if self.pending_restart else 0
+        for bit, key in enumerate(RECORDED_KEYS):
+            if keys_pressed[key]:
+                flags |= 1 << bit
+        
+        self.frames += FRAME.pack(dt_us, mouse_x, mouse_y, flags)
+        self.frame_count += 1
+        self.pending_restart = False
+        return dt_us / 1_000_000, (mouse_x, mouse_y)
+    
+    def save(self, player, won: bool):
+        """Write the session log, storing the final pose for replay verification"""
+        header = HEADER.pack(MAGIC, VERSION, self.seed, self.maze_width, self.maze_height, won,
+                             player.x, player.y, player.angle, player.pitch, self.frame_count)
+        with open(self.path, "wb") as f:
+            f.write(header)
+            f.write(zlib.compress(bytes(self.frames)))
+
+
+def load_recording(path: str) -> Recording:
+    """Read a session log written by InputRecorder"""
+    with open(path, "rb") as f:
+        data = f.read()
+    
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is truncated: missing session header")
+    
+    (magic, version, seed, maze_width, maze_height, won,
+     x, y, angle, pitch, frame_count) = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} session log")
+    try:
+        check_maze_size(maze_width, maze_height)
+    except ValueError as e:
+        raise ValueError(f"{path} has an invalid header: {e}") from e
+    
+    try:
+        payload = zlib.decompress(data[HEADER.size:])
+    except zlib.error as e:
+        raise ValueError(f"{path} has a corrupt frame payload: {e}") from e
+    if len(payload) != frame_count * FRAME.size:
+        raise ValueError(f"{path} is truncated: expected {frame_count} frames")
+    
+    # Key states repeat heavily, so share one RecordedKeys per distinct mask
+    keys_cache = {}
+    frames = []
+    for dt_us, mouse_x, mouse_y, flags in FRAME.iter_unpack(payload):
+        mask = flags & ~RESTART_FLAG
+        keys = keys_cache.get(mask)
+        if keys is None:
+            keys = keys_cache[mask] = RecordedKeys(mask)
+        frames.append(InputFrame(dt_us / 1_000_000, (mouse_x, mouse_y), keys, bool(flags & RESTART_FLAG)))
+    
+    return Recording(seed, maze_width, maze_height, won, (x, y, angle, pitch), frames)
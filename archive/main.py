@@ -3,13 +3,20 @@
 import pygame
 import sys
 import time
+import random
+import argparse
 from maze_generator import MazeGenerator
 from renderer_3d import Renderer3D
 from player import Player
+from hud import HUD
+from input_log import InputRecorder, MAX_SEED
 
 class LabyrinthGame:
-    def __init__(self):
-        pygame.init()
+    def __init__(self, seed: int = None, maze_size: tuple = (51, 51), headless: bool = False,
+                 recorder: InputRecorder = None):
+        # Headless games only simulate (used for fast replay), no window or fonts
+        self.headless = headless
+        self.recorder = recorder
         
         # Game settings
         self.width = 1024
@@ -17,14 +24,16 @@ class LabyrinthGame:
         self.fps = 60
         
         # Initialize components
-        self.renderer = Renderer3D(self.width, self.height)
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 24)
+        if not self.headless:
+            pygame.init()
+            self.renderer = Renderer3D(self.width, self.height)
+            self.clock = pygame.time.Clock()
+            self.hud = HUD(self.width, self.height)
         
         # Generate maze
-        self.maze_width = 51  # Odd numbers work best for maze generation
-        self.maze_height = 51
-        self.maze_generator = MazeGenerator(self.maze_width, self.maze_height)
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.maze_width, self.maze_height = maze_size  # Odd numbers work best for maze generation
+        self.maze_generator = MazeGenerator(self.maze_width, self.maze_height, random.Random(self.seed))
         self.maze = self.maze_generator.generate()
         
         # Create player at center
@@ -36,6 +45,12 @@ class LabyrinthGame:
         self.running = True
         self.won = False
         
+        if self.recorder:
+            self.recorder.begin(self.seed, self.maze_width, self.maze_height)
+        
+        if self.headless:
+            return
+        
         # Hide mouse cursor and capture mouse
         pygame.mouse.set_visible(False)
         pygame.event.set_grab(True)
@@ -63,18 +78,24 @@ class LabyrinthGame:
         
         return mouse_rel
     
-    def update(self, dt: float, mouse_rel: tuple):
+    def update(self, dt: float, mouse_rel: tuple, keys_pressed=None):
         """Update game state"""
-        if not self.won:
-            # Get current key states
+        # Get current key states unless they are supplied (replay)
+        if keys_pressed is None:
             keys_pressed = pygame.key.get_pressed()
-            
+        
+        if self.recorder:
+            dt, mouse_rel = self.recorder.record(dt, mouse_rel, keys_pressed)
+        
+        if not self.won:
             # Update player
             self.player.update(dt, keys_pressed, mouse_rel, self.maze)
             
             # Check win condition
             if self.player.is_at_exit(self.maze):
                 self.won = True
+                if self.headless:
+                    return
                 print("Congratulations! You escaped the labyrinth!")
                 print("Press 'R' to play again or ESC to quit")
     
@@ -93,29 +114,13 @@ class LabyrinthGame:
             
             # Render UI
             fps = int(self.clock.get_fps())
-            self.renderer.render_ui(self.font, fps, player_x, player_y, player_angle, self.maze)
+            self.hud.render_ui(self.renderer.screen, fps)
         else:
             # Render win screen
-            self.render_win_screen()
+            self.hud.render_win_screen(self.renderer.screen)
         
         self.renderer.display()
     
-    def render_win_screen(self):
-        """Render the victory screen"""
-        # Win message
-        win_text = pygame.font.Font(None, 72).render("YOU ESCAPED!", True, (0, 255, 0))
-        win_rect = win_text.get_rect(center=(self.width//2, self.height//2 - 50))
-        self.renderer.screen.blit(win_text, win_rect)
-        
-        # Instructions
-        restart_text = self.font.render("Press 'R' to play again", True, (255, 255, 255))
-        restart_rect = restart_text.get_rect(center=(self.width//2, self.height//2 + 20))
-        self.renderer.screen.blit(restart_text, restart_rect)
-        
-        quit_text = self.font.render("Press ESC to quit", True, (255, 255, 255))
-        quit_rect = quit_text.get_rect(center=(self.width//2, self.height//2 + 50))
-        self.renderer.screen.blit(quit_text, quit_rect)
-    
     def restart_game(self):
         """Restart the game with a new maze"""
         # Generate new maze
@@ -128,6 +133,11 @@ class LabyrinthGame:
         # Reset game state
         self.won = False
         
+        if self.recorder:
+            self.recorder.mark_restart()
+        if self.headless:
+            return
+        
         print("New labyrinth generated!")
     
     def run(self):
@@ -151,9 +161,29 @@ class LabyrinthGame:
             # Control frame rate
             self.clock.tick(self.fps)
         
+        if self.recorder:
+            self.recorder.save(self.player, self.won)
+            print(f"Session recorded to {self.recorder.path}")
+        
+        print(f"HUD text cache: {self.hud.hits} hits, {self.hud.misses} misses "
+              f"({self.hud.hit_rate:.1%} hit rate)")
+        
         pygame.quit()
         sys.exit()
 
+def seed_arg(value: str) -> int:
+    """Parse a --seed value, rejecting seeds a session log cannot store"""
+    seed = int(value)
+    if not 0 <= seed <= MAX_SEED:
+        raise argparse.ArgumentTypeError(f"must be 0 to {MAX_SEED}, got {seed}")
+    return seed
+
 if __name__ == "__main__":
-    game = LabyrinthGame()
+    parser = argparse.ArgumentParser(description="3D Labyrinth Escape")
+    parser.add_argument("--seed", type=seed_arg, help="Maze seed, 0 to 2**32-1 (random if omitted)")
+    parser.add_argument("--record", metavar="PATH", help="Record the session's input to PATH")
+    args = parser.parse_args()
+    
+    recorder = InputRecorder(args.record) if args.record else None
+    game = LabyrinthGame(seed=args.seed, recorder=recorder)
     game.run()
\ No newline at end of file
@@ -2,9 +2,10 @@ import random
 from typing import List, Tuple, Set
 
 class MazeGenerator:
-    def __init__(self, width: int, height: int):
+    def __init__(self, width: int, height: int, rng: random.Random = None):
         self.width = width
         self.height = height
+        self.rng = rng if rng is not None else random.Random()  # Own RNG so sessions can be seeded
         self.maze = [[1 for _ in range(width)] for _ in range(height)]  # 1 = wall, 0 = path
         
     def generate(self) -> List[List[int]]:
@@ -28,7 +29,7 @@ class MazeGenerator:
         
         # Get random directions
         directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
-        random.shuffle(directions)
+        self.rng.shuffle(directions)
         
         for dx, dy in directions:
             nx, ny = x + dx, y + dy
@@ -60,8 +61,8 @@ class MazeGenerator:
         for _ in range(num_passages):
             # Pick a random wall that could become a passage
             for attempt in range(50):  # Try up to 50 times
-                x = random.randrange(1, self.width - 1)
-                y = random.randrange(1, self.height - 1)
+                x = self.rng.randrange(1, self.width - 1)
+                y = self.rng.randrange(1, self.height - 1)
                 
                 # Only consider walls that are surrounded by at least 2 paths
                 if self.maze[y][x] == 1:
@@ -78,7 +79,7 @@ class MazeGenerator:
                     # If this wall has 2 or more adjacent paths, consider making it a passage
                     if adjacent_paths >= 2:
                         # 30% chance to create the passage (creates more variety)
-                        if random.random() < 0.3:
+                        if self.rng.random() < 0.3:
                             self.maze[y][x] = 0
                             break
     
@@ -102,7 +103,7 @@ class MazeGenerator:
                 edges.append((self.width - 1, y))
         
         if edges:
-            exit_x, exit_y = random.choice(edges)
+            exit_x, exit_y = self.rng.choice(edges)
             self.maze[exit_y][exit_x] = 2  # 2 = exit
     
     def get_center_position(self) -> Tuple[int, int]:
@@ -259,23 +259,6 @@ class Renderer3D:
         # Draw a small triangle to show direction more clearly
         pygame.draw.circle(self.screen, self.RED, (end_x, end_y), 3)
     
-    def render_ui(self, font, fps: int, player_x=None, player_y=None, player_angle=None, maze=None):
-        """Render UI elements"""
-        # FPS counter
-        fps_text = font.render(f"FPS: {fps}", True, self.BLACK)
-        self.screen.blit(fps_text, (10, 10))
-        
-        # Instructions
-        instructions = [
-            "WASD: Move",
-            "Mouse: Look around",
-            "ESC: Quit"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            text = font.render(instruction, True, self.BLACK)
-            self.screen.blit(text, (10, 40 + i * 20))
-    
     def display(self):
         """Update the display"""
         pygame.display.flip()
\ No newline at end of file
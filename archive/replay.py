@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+import pygame
+import sys
+import math
+import time
+import argparse
+from multiprocessing import Pool
+from typing import List, NamedTuple, Tuple
+from input_log import Recording, load_recording
+from main import LabyrinthGame
+
+
+class ReplayResult(NamedTuple):
+    path: str
+    pose: Tuple[float, float, float, float]
+    expected_pose: Tuple[float, float, float, float]
+    won: bool
+    matched: bool
+    error: str = None  # Set when the log could not be read or the replay was aborted
+
+
+def _make_game(recording: Recording, headless: bool) -> LabyrinthGame:
+    return LabyrinthGame(seed=recording.seed,
+                         maze_size=(recording.maze_width, recording.maze_height),
+                         headless=headless)
+
+
+def _result(path: str, recording: Recording, game: LabyrinthGame) -> ReplayResult:
+    player = game.player
+    pose = (player.x, player.y, player.angle, player.pitch)
+    matched = (game.won == recording.won and
+               all(math.isclose(a, b, rel_tol=0.0, abs_tol=1e-9)
+                   for a, b in zip(pose, recording.final_pose)))
+    return ReplayResult(path, pose, recording.final_pose, game.won, matched)
+
+
+def replay_headless(path: str) -> ReplayResult:
+    """Re-simulate a session as fast as possible, without a window"""
+    recording = load_recording(path)
+    game = _make_game(recording, headless=True)
+    
+    for frame in recording.frames:
+        if frame.restart:
+            game.restart_game()
+        elif game.won:
+            continue  # Nothing moves on the win screen
+        game.update(frame.dt, frame.mouse_rel, frame.keys)
+    
+    return _result(path, recording, game)
+
+
+def replay_realtime(path: str) -> ReplayResult:
+    """Re-play a session with rendering, paced by the recorded frame times"""
+    recording = load_recording(path)
+    game = _make_game(recording, headless=False)
+    
+    next_frame_time = time.perf_counter()
+    for frame in recording.frames:
+        # Only quitting is honoured, any other live input would desync the replay
+        for event in pygame.event.get():
+            if (event.type == pygame.QUIT or
+                    (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE)):
+                game.running = False
+        if not game.running:
+            pygame.quit()
+            return _failed(path, "aborted")
+        
+        if frame.restart:
+            game.restart_game()
+        game.update(frame.dt, frame.mouse_rel, frame.keys)
+        game.render()
+        
+        # Hold each frame for as long as it took when recorded
+        next_frame_time += frame.dt
+        delay = next_frame_time - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        game.clock.tick()  # Keeps the HUD's FPS counter running
+    
+    result = _result(path, recording, game)
+    pygame.quit()
+    return result
+
+
+def _failed(path: str, error: str) -> ReplayResult:
+    return ReplayResult(path, None, None, False, False, error)
+
+
+def _replay_checked(path: str) -> ReplayResult:
+    """Headless replay that reports any per-session error as a failure instead of raising"""
+    try:
+        return replay_headless(path)
+    except Exception as e:
+        return _failed(path, f"{type(e).__name__}: {e}")
+
+
+def replay_many(paths: List[str], processes: int = None) -> List[ReplayResult]:
+    """Headless-replay many sessions in parallel across worker processes"""
+    with Pool(processes) as pool:
+        return pool.map(_replay_checked, paths, chunksize=max(1, len(paths) // 64))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay recorded labyrinth sessions")
+    parser.add_argument("paths", nargs="+", help="Session logs written with main.py --record")
+    parser.add_argument("--realtime", action="store_true", help="Render the replay (one session at a time)")
+    parser.add_argument("--processes", type=int, help="Worker processes for headless replay")
+    args = parser.parse_args()
+    
+    if args.realtime:
+        results = []
+        for path in args.paths:
+            try:
+                results.append(replay_realtime(path))
+            except (OSError, ValueError) as e:
+                results.append(_failed(path, str(e)))
+    else:
+        results = replay_many(args.paths, args.processes)
+    
+    failures = 0
+    for result in results:
+        if result.error:
+            failures += 1
+            print(f"ERROR {result.path}: {result.error}")
+        elif not result.matched:
+            failures += 1
+            print(f"MISMATCH {result.path}: got {result.pose}, expected {result.expected_pose}")
+    
+    print(f"Replayed {len(results)} session(s), {failures} failure(s)")
+    sys.exit(1 if failures else 0)